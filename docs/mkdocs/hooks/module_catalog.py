@@ -6,18 +6,22 @@ documentation pages for each module type (providers, tools, hooks, orchestrators
 """
 
 import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
-try:
-    import tomli
-except ImportError:
-    tomli = None
+from mkdocs.structure.files import File
 
 try:
-    import yaml
+    import tomllib
 except ImportError:
-    yaml = None
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
 
 log = logging.getLogger("mkdocs.hooks.module_catalog")
 
@@ -55,49 +59,237 @@ MODULE_TYPES = {
     },
 }
 
+# Derived values used in the discovery and logging loops
+for _config in MODULE_TYPES.values():
+    _config["prefix_len"] = len(_config["prefix"])
+    _config["display_name_lower"] = _config["display_name"].lower()
+del _config
+
+# All module prefixes share this stem; the next dash-separated token names the
+# type (e.g. "tool" in amplifier-module-tool-bash)
+MODULE_PREFIX = "amplifier-module-"
+_TYPE_BY_KIND = {
+    config["prefix"][len(MODULE_PREFIX):-1]: module_type
+    for module_type, config in MODULE_TYPES.items()
+}
+
+# Markers replaced in page markdown: <!-- MODULE_CATALOG --> and one
+# <!-- MODULE_LIST_<TYPE> --> per module type
+_PLACEHOLDER_RE = re.compile(
+    r"<!-- MODULE_(CATALOG|LIST_(?:"
+    + "|".join(module_type.upper() for module_type in MODULE_TYPES)
+    + r")) -->"
+)
+
+# Fixed part of a generated module page, ahead of the README body
+_PAGE_HEAD_TMPL = """# {title}
+
+{description}
+
+## Overview
+
+| Property | Value |
+|----------|-------|
+| **Module ID** | `{ep}` |
+| **Package** | `{full}` |
+| **Type** | {type_display} |
+| **Repository** | [github.com/microsoft/{full}](https://github.com/microsoft/{full}) |
+
+## Installation
+
+This module is installed automatically when referenced in a profile or mount plan.
+
+```yaml
+{mt}s:
+  - module: {ep}
+    source: git+https://github.com/microsoft/{full}@main
+```
+
+## Documentation
+
+The full documentation for this module is maintained in its repository:
+
+**[View Full Documentation →](https://github.com/microsoft/{full})**
+
+---
+
+"""
+
+# One catalog table row; descriptions longer than this are cut to fit
+_CATALOG_ROW = "| [{name}]({path}/{slug}.md) | {desc} |\n".format_map
+_CATALOG_DESC_MAX = 80
+
+# Caches reused across on_config runs during `mkdocs serve`, keyed by path and
+# invalidated whenever the recorded mtimes no longer match
+_MODULE_INFO_CACHE: dict[str, tuple[int, dict[str, Any]]] = {}
+_README_CACHE: dict[str, tuple[int, bytes]] = {}
+_MODULE_DIRS_CACHE: dict[str, tuple[int, dict[str, list[Path]]]] = {}
+
+# Fast path for the few pyproject.toml keys we need; anything these don't
+# match (escapes, multi-line strings, inline tables) falls back to tomllib
+_PROJECT_TABLE_RE = re.compile(rb"(?ms)^\[project\][ \t]*\r?$(.*?)(?=^[ \t]*\[|\Z)")
+_EP_SECTION_RE = re.compile(
+    rb'(?ms)^\[project\.entry-points\."amplifier\.modules"\][ \t]*\r?$(.*?)(?=^[ \t]*\[|\Z)'
+)
+_DESC_RE = re.compile(rb'(?m)^description[ \t]*=[ \t]*"([^"\\\r\n]*)"[ \t]*(?:#[^\r\n]*)?\r?$')
+_VER_RE = re.compile(rb'(?m)^version[ \t]*=[ \t]*"([^"\\\r\n]*)"[ \t]*(?:#[^\r\n]*)?\r?$')
+# First key of the entry-point table, after any blank or comment lines; only
+# a plain bare key or a basic quoted key (no dotted keys) is accepted
+_EP_KEY_RE = re.compile(
+    rb'(?:[ \t]*(?:#[^\n]*)?\r?\n)*[ \t]*(?:"([^"\\\r\n]*)"|([A-Za-z0-9_\-]+))[ \t]*='
+)
+
+# First "# " line of a README with its line break (the preceding one when it's
+# the last line), matching what joining the remaining lines would leave
+_FIRST_H1_RE = re.compile(rb"(?m)^# [^\n]*\n|\n?^# [^\n]*\Z")
+
+
+def _scan_pyproject(raw: bytes) -> dict[str, str] | None:
+    """Pull description, version and entry point out of raw pyproject bytes.
+
+    Returns None if any of them can't be found, so the caller can fall back
+    to a full TOML parse.
+    """
+    project = _PROJECT_TABLE_RE.search(raw)
+    entry_points = _EP_SECTION_RE.search(raw)
+    if not project or not entry_points:
+        return None
+
+    # Lines inside a multi-line string could look like keys
+    project_body = project.group(1)
+    if b'"""' in project_body or b"'''" in project_body:
+        return None
+
+    description = _DESC_RE.search(project_body)
+    version = _VER_RE.search(project_body)
+    entry_point = _EP_KEY_RE.match(entry_points.group(1))
+    if not description or not version or not entry_point:
+        return None
+
+    quoted_key, bare_key = entry_point.groups()
+    return {
+        "description": description.group(1).decode("utf-8"),
+        "version": version.group(1).decode("utf-8"),
+        "entry_point": (bare_key if quoted_key is None else quoted_key).decode("utf-8"),
+    }
+
 
 def get_module_info(module_path: Path) -> dict[str, Any] | None:
     """Extract module information from pyproject.toml and README."""
     pyproject_path = module_path / "pyproject.toml"
     readme_path = module_path / "README.md"
 
-    if not pyproject_path.exists():
+    try:
+        stamp = pyproject_path.stat().st_mtime_ns
+    except OSError:
         return None
 
+    cache_key = str(pyproject_path)
+    cached = _MODULE_INFO_CACHE.get(cache_key)
+    if cached and cached[0] == stamp:
+        return cached[1].copy()
+
     info = {
         "name": module_path.name,
         "path": str(module_path),
         "description": "",
         "version": "",
         "entry_point": "",
-        "readme_content": "",
+        # README is only read if a page embeds it (see _get_readme)
+        "_readme_path": readme_path,
     }
 
     # Parse pyproject.toml
-    if tomli:
-        try:
-            with open(pyproject_path, "rb") as f:
-                data = tomli.load(f)
-                project = data.get("project", {})
-                info["description"] = project.get("description", "")
-                info["version"] = project.get("version", "")
-
-                # Get entry point
-                entry_points = project.get("entry-points", {})
-                amplifier_modules = entry_points.get("amplifier.modules", {})
-                if amplifier_modules:
-                    info["entry_point"] = list(amplifier_modules.keys())[0]
-        except Exception as e:
-            log.warning(f"Failed to parse {pyproject_path}: {e}")
-
-    # Read README
-    if readme_path.exists():
+    try:
+        raw = pyproject_path.read_bytes()
+        scanned = _scan_pyproject(raw)
+        if scanned:
+            info.update(scanned)
+        elif tomllib:
+            data = tomllib.loads(raw.decode("utf-8"))
+            project = data.get("project", {})
+            info["description"] = project.get("description", "")
+            info["version"] = project.get("version", "")
+
+            # Get entry point
+            entry_points = project.get("entry-points", {})
+            amplifier_modules = entry_points.get("amplifier.modules", {})
+            if amplifier_modules:
+                info["entry_point"] = list(amplifier_modules.keys())[0]
+    except Exception as e:
+        log.warning(f"Failed to parse {pyproject_path}: {e}")
+
+    # Catalog cell text, truncated once here rather than on every render
+    description = info["description"]
+    if len(description) > _CATALOG_DESC_MAX:
+        description = description[:_CATALOG_DESC_MAX - 3] + "..."
+    info["desc_short"] = description
+
+    _MODULE_INFO_CACHE[cache_key] = (stamp, info)
+    return info.copy()
+
+
+def _get_readme(module_info: dict[str, Any]) -> bytes:
+    """Return a module's README bytes, reusing the last read if unchanged."""
+    if "readme_content" not in module_info:
+        readme_path = module_info.get("_readme_path")
+        content = b""
         try:
-            info["readme_content"] = readme_path.read_text()
-        except Exception as e:
-            log.warning(f"Failed to read {readme_path}: {e}")
+            stamp = readme_path.stat().st_mtime_ns if readme_path else None
+        except OSError:
+            stamp = None  # No README
+
+        if stamp is not None:
+            cache_key = str(readme_path)
+            cached = _README_CACHE.get(cache_key)
+            if cached and cached[0] == stamp:
+                content = cached[1]
+            else:
+                try:
+                    # Normalise CRLF/CR line endings as read_text() used to
+                    content = readme_path.read_bytes().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+                except Exception as e:
+                    log.warning(f"Failed to read {readme_path}: {e}")
+                else:
+                    _README_CACHE[cache_key] = (stamp, content)
+        module_info["readme_content"] = content
+    return module_info["readme_content"]
+
+
+def find_module_dirs(base_path: Path) -> dict[str, list[Path]]:
+    """Find module directories by type, reusing the last scan if unchanged."""
+    # Adding, removing or renaming a module directory bumps the parent's mtime;
+    # edits inside a module are picked up by the get_module_info cache instead
+    cache_key = str(base_path)
+    stamp = base_path.stat().st_mtime_ns
+    cached = _MODULE_DIRS_CACHE.get(cache_key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    dirs_by_type: dict[str, list[Path]] = {key: [] for key in MODULE_TYPES}
+
+    with os.scandir(base_path) as entries:
+        for entry in entries:
+            if not entry.name.startswith(MODULE_PREFIX):
+                continue
+            parts = entry.name.split("-", 3)
+            module_type = _TYPE_BY_KIND.get(parts[2]) if len(parts) == 4 else None
+            if module_type and entry.is_dir():
+                dirs_by_type[module_type].append(Path(entry.path))
+
+    _MODULE_DIRS_CACHE[cache_key] = (stamp, dirs_by_type)
+    return dirs_by_type
+
 
-    return info
+def _has_amplifier_modules(base_path: Path) -> bool:
+    """Check whether base_path contains at least one module directory."""
+    try:
+        with os.scandir(base_path) as entries:
+            return any(
+                e.name.startswith(MODULE_PREFIX) and e.is_dir() for e in entries
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return False
 
 
 def discover_modules(base_path: Path) -> dict[str, list[dict[str, Any]]]:
@@ -106,18 +298,29 @@ def discover_modules(base_path: Path) -> dict[str, list[dict[str, Any]]]:
         key: [] for key in MODULE_TYPES
     }
 
-    for module_type, config in MODULE_TYPES.items():
-        prefix = config["prefix"]
-        for path in base_path.iterdir():
-            if path.is_dir() and path.name.startswith(prefix):
-                info = get_module_info(path)
-                if info:
-                    # Extract the module name without prefix
-                    info["short_name"] = path.name[len(prefix):]
-                    modules_by_type[module_type].append(info)
-
-        # Sort by name
-        modules_by_type[module_type].sort(key=lambda x: x["short_name"])
+    typed_paths = [
+        (module_type, path)
+        for module_type, paths in find_module_dirs(base_path).items()
+        for path in paths
+    ]
+
+    # Reading and parsing each module's files is independent I/O
+    max_workers = min(32, (os.cpu_count() or 4) * 2, max(len(typed_paths), 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        infos = list(executor.map(get_module_info, (path for _, path in typed_paths)))
+
+    for (module_type, path), info in zip(typed_paths, infos):
+        if info:
+            prefix_len = MODULE_TYPES[module_type]["prefix_len"]
+            # Extract the module name without prefix
+            info["short_name"] = short_name = path.name[prefix_len:]
+            info["title"] = short_name.replace("-", " ").title()
+            info["slug"] = short_name.replace("-", "_")
+            modules_by_type[module_type].append(info)
+
+    # Sort by name
+    for module_list in modules_by_type.values():
+        module_list.sort(key=itemgetter("short_name"))
 
     return modules_by_type
 
@@ -125,62 +328,34 @@ def discover_modules(base_path: Path) -> dict[str, list[dict[str, Any]]]:
 def generate_module_page(module_info: dict[str, Any], module_type: str) -> str:
     """Generate a documentation page for a module."""
     config = MODULE_TYPES[module_type]
-    name = module_info["short_name"]
+    title = module_info["title"]
     full_name = module_info["name"]
     description = module_info["description"]
     entry_point = module_info["entry_point"]
-    readme = module_info["readme_content"]
-
-    # Generate page content
-    content = f"""# {name.replace("-", " ").title()}
-
-{description}
-
-## Overview
-
-| Property | Value |
-|----------|-------|
-| **Module ID** | `{entry_point}` |
-| **Package** | `{full_name}` |
-| **Type** | {config["display_name"]} |
-| **Repository** | [github.com/microsoft/{full_name}](https://github.com/microsoft/{full_name}) |
-
-## Installation
-
-This module is installed automatically when referenced in a profile or mount plan.
-
-```yaml
-{module_type}s:
-  - module: {entry_point}
-    source: git+https://github.com/microsoft/{full_name}@main
-```
-
-## Documentation
-
-The full documentation for this module is maintained in its repository:
-
-**[View Full Documentation →](https://github.com/microsoft/{full_name})**
-
----
-
-"""
+    readme = _get_readme(module_info)
+
+    # Generate page content as bytes so the README can be appended undecoded
+    buf = bytearray(_PAGE_HEAD_TMPL.format(
+        title=title,
+        description=description,
+        ep=entry_point,
+        full=full_name,
+        type_display=config["display_name"],
+        mt=module_type,
+    ).encode())
+    head_len = len(buf)
 
     # Include README content if available (after first heading)
     if readme:
         # Skip the first heading (# Module Name) if present
-        lines = readme.split("\n")
-        skip_first_heading = False
-        filtered_lines = []
-        for line in lines:
-            if line.startswith("# ") and not skip_first_heading:
-                skip_first_heading = True
-                continue
-            filtered_lines.append(line)
-
-        if filtered_lines:
-            content += "\n".join(filtered_lines)
+        buf += _FIRST_H1_RE.sub(b"", readme, count=1)
 
-    return content
+    try:
+        return buf.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # Only the README can be undecodable; keep the page without its body
+        log.warning(f"Failed to read {module_info.get('_readme_path')}: {e}")
+        return buf[:head_len].decode("utf-8")
 
 
 def on_config(config: dict[str, Any]) -> dict[str, Any]:
@@ -193,31 +368,42 @@ def on_config(config: dict[str, Any]) -> dict[str, Any]:
     base_path = docs_dir.parent.parent  # Go from amplifier-docs/docs to potential amplifier-dev
 
     # Check if we're in the amplifier-dev context (has module directories)
-    has_modules = any(
-        p.is_dir() and p.name.startswith("amplifier-module-")
-        for p in base_path.iterdir()
-    ) if base_path.exists() else False
-
-    if has_modules:
+    if _has_amplifier_modules(base_path):
         modules = discover_modules(base_path)
-        # Log discovered modules
-        for module_type, module_list in modules.items():
-            if module_list:
-                log.info(f"  Found {len(module_list)} {MODULE_TYPES[module_type]['display_name'].lower()}")
+        # Log discovered modules (skipped entirely unless INFO is enabled)
+        if log.isEnabledFor(logging.INFO):
+            for module_type, module_list in modules.items():
+                if module_list:
+                    log.info(f"  Found {len(module_list)} {MODULE_TYPES[module_type]['display_name_lower']}")
     else:
         log.info("  No local modules found (standalone mode)")
         modules = {key: [] for key in MODULE_TYPES}
 
     # Store modules in config for later use
     config["amplifier_modules"] = modules
+    # Render placeholder content once per build, keyed by marker name
+    rendered = {"CATALOG": generate_module_catalog(modules)}
+    for module_type in MODULE_TYPES:
+        rendered[f"LIST_{module_type.upper()}"] = generate_module_list(
+            modules.get(module_type, []), module_type
+        )
+    config["_amplifier_rendered"] = rendered
 
     return config
 
 
 def on_files(files: Any, config: dict[str, Any]) -> Any:
     """MkDocs hook called after files are collected."""
-    # This hook could be used to dynamically generate module pages
-    # For now, we rely on the static pages that link to module READMEs
+    # Generate an in-memory page for every discovered module that doesn't
+    # already have a hand-written page under its docs path
+    for module_type, module_list in config.get("amplifier_modules", {}).items():
+        docs_path = MODULE_TYPES[module_type]["docs_path"]
+        for module_info in module_list:
+            src_uri = f"{docs_path}/{module_info['slug']}.md"
+            if files.get_file_from_path(src_uri) is None:
+                files.append(File.generated(
+                    config, src_uri, content=generate_module_page(module_info, module_type)
+                ))
     return files
 
 
@@ -225,47 +411,42 @@ def on_page_markdown(
     markdown: str, page: Any, config: dict[str, Any], files: Any
 ) -> str:
     """MkDocs hook called for each page's markdown content."""
-    # Replace placeholder markers with dynamic content
-    modules = config.get("amplifier_modules", {})
-
-    # Replace module catalog placeholder
-    if "<!-- MODULE_CATALOG -->" in markdown:
-        catalog = generate_module_catalog(modules)
-        markdown = markdown.replace("<!-- MODULE_CATALOG -->", catalog)
+    # Most pages have no placeholders at all
+    if "<!-- MODULE_" not in markdown:
+        return markdown
 
-    # Replace specific module type placeholders
-    for module_type, config_data in MODULE_TYPES.items():
-        placeholder = f"<!-- MODULE_LIST_{module_type.upper()} -->"
-        if placeholder in markdown:
-            module_list = generate_module_list(modules.get(module_type, []), module_type)
-            markdown = markdown.replace(placeholder, module_list)
-
-    return markdown
+    # Replace placeholder markers with content rendered in on_config
+    rendered = config["_amplifier_rendered"]
+    return _PLACEHOLDER_RE.sub(lambda match: rendered[match.group(1)], markdown)
 
 
 def generate_module_catalog(modules: dict[str, list[dict[str, Any]]]) -> str:
     """Generate a full module catalog."""
-    content = ""
+    parts: list[str] = []
 
     for module_type, module_list in modules.items():
         if not module_list:
             continue
 
         config = MODULE_TYPES[module_type]
-        content += f"\n### {config['display_name']}\n\n"
-        content += f"{config['description']}\n\n"
-        content += "| Module | Description |\n"
-        content += "|--------|-------------|\n"
+        parts.extend((
+            f"\n### {config['display_name']}\n\n",
+            f"{config['description']}\n\n",
+            "| Module | Description |\n|--------|-------------|\n",
+        ))
 
+        docs_path = config["docs_path"]
         for module in module_list:
-            name = module["short_name"]
-            desc = module["description"][:80] + "..." if len(module["description"]) > 80 else module["description"]
-            link = f"[{name}]({config['docs_path']}/{name.replace('-', '_')}.md)"
-            content += f"| {link} | {desc} |\n"
+            parts.append(_CATALOG_ROW({
+                "name": module["short_name"],
+                "path": docs_path,
+                "slug": module["slug"],
+                "desc": module["desc_short"],
+            }))
 
-        content += "\n"
+        parts.append("\n")
 
-    return content
+    return "".join(parts)
 
 
 def generate_module_list(modules: list[dict[str, Any]], module_type: str) -> str:
@@ -273,20 +454,19 @@ def generate_module_list(modules: list[dict[str, Any]], module_type: str) -> str
     if not modules:
         return "*No modules found.*"
 
-    content = ""
+    parts: list[str] = []
     for module in modules:
-        name = module["short_name"]
         desc = module["description"]
         entry_point = module["entry_point"]
 
-        content += f"""
+        parts.append(f"""
 <div class="module-card">
 <div class="content">
-<h4><a href="{name.replace('-', '_')}.md">{name.replace("-", " ").title()}</a></h4>
+<h4><a href="{module['slug']}.md">{module['title']}</a></h4>
 <p>{desc}</p>
 <code>{entry_point}</code>
 </div>
 </div>
-"""
+""")
 
-    return content
+    return "".join(parts)